@@ -190,20 +190,51 @@ class SphereDynamics:
         # enforce sphere constraint: x_i <- x_i / ||x_i||
         self.positions = self._normalize_to_sphere(self.positions)
     
-    def simulate(self, n_steps: int) -> tuple[np.ndarray, np.ndarray]:
+    def simulate(
+        self,
+        n_steps: int,
+        store_trajectory: bool | None = None,
+        out: np.ndarray | None = None,
+        velocity_out: np.ndarray | None = None
+    ) -> tuple[np.ndarray | None, np.ndarray | None]:
         """
         run simulation for n_steps time steps.
         
+        out / velocity_out are optional preallocated buffers of shape (n_steps, N, n_dims)
+        for the position / velocity history, e.g. an np.memmap so that long runs do not
+        have to fit in RAM. values are cast to the buffer's dtype.
+        
+        store_trajectory controls in-memory history: if True, a history without a buffer
+        is allocated in memory; if False, only the given buffers are written and the
+        other history is None (with no buffers, only the final state is kept in
+        self.positions / self.velocities). defaults to True when no buffers are given
+        and False otherwise.
+        
         returns:
-        trajectory : np.ndarray of shape (n_steps, N, n_dims) - position history
-        velocity_history : np.ndarray of shape (n_steps, N, n_dims) - velocity history
+        trajectory : np.ndarray of shape (n_steps, N, n_dims) - position history (None if not stored)
+        velocity_history : np.ndarray of shape (n_steps, N, n_dims) - velocity history (None if not stored)
         """
-        trajectory = np.zeros((n_steps, self.N, self.n_dims))
-        velocity_history = np.zeros((n_steps, self.N, self.n_dims))
+        history_shape = (n_steps, self.N, self.n_dims)
+        for buffer in (out, velocity_out):
+            if buffer is not None and buffer.shape != history_shape:
+                raise ValueError(f"Output buffer must have shape {history_shape}, got {buffer.shape}")
+        
+        if store_trajectory is None:
+            store_trajectory = out is None and velocity_out is None
+        
+        trajectory = out
+        velocity_history = velocity_out
+        if store_trajectory:
+            if trajectory is None:
+                trajectory = np.zeros(history_shape)
+            if velocity_history is None:
+                velocity_history = np.zeros(history_shape)
         
         for t in range(n_steps):
-            trajectory[t] = self.positions.copy()
-            velocity_history[t] = self.velocities.copy()
+            if trajectory is not None:
+                trajectory[t] = self.positions
+            if velocity_history is not None:
+                velocity_history[t] = self.velocities
             self.step()
         
         return trajectory, velocity_history
@@ -1,30 +1,198 @@
 from model.dynamical_model import SphereDynamics
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved to disk, never shown
 import matplotlib.pyplot as plt
-from sklearn.decomposition import PCA
-from sklearn.manifold import TSNE
+from openTSNE import TSNE
 from umap import UMAP
+import os
 from pathlib import Path
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from matplotlib.colors import Normalize
+from PIL import Image
+from joblib import Parallel, delayed
+from sklearn.utils.extmath import randomized_svd
 
 
-def analyze_manifold_pca(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle'):
+# output resolution: scatter plots only need moderate DPI, and the heatmap is a
+# coarse (n_particles, n_particles) grid that gains nothing from more pixels
+SCATTER_DPI = 150
+HEATMAP_DPI = 100
+# fast zlib level for PNG encoding, trading file size for save speed
+PNG_PIL_KWARGS = {'compress_level': 1}
+# fixed heatmap margins, leaving room for the axis labels and colorbar
+HEATMAP_MARGINS = dict(left=0.12, right=0.95, bottom=0.1, top=0.92)
+# target pixel size of the plain (non-detailed) inner product heatmap image; each
+# cell is upscaled by a whole factor, so larger matrices keep one pixel per cell
+HEATMAP_IMAGE_SIZE = 500
+# particle count from which scatter markers are drawn small and opaque
+LARGE_SCATTER_THRESHOLD = 10_000
+# ambient dimension from which PCA switches from eigh to randomized SVD
+RANDOMIZED_PCA_MIN_DIMENSIONS = 50
+
+# simulation results saved by run_simulation(use_cache=True)
+CACHE_DIR = Path("cache")
+
+# shared 3D scatter figure, created on first use and cleared between plots
+_SCATTER_FIG = None
+_SCATTER_AX = None
+_SCATTER_SPEC = None
+_SCATTER_CBAR = None
+
+
+def _get_scatter_axes():
+    """
+    return the shared 3D scatter figure and axes, cleared for a new plot.
+    
+    creating a figure with 3D axes is slow, so every projection draws into the
+    same long-lived figure instead of building and closing a new one each call.
+    """
+    global _SCATTER_FIG, _SCATTER_AX, _SCATTER_SPEC, _SCATTER_CBAR
+    if _SCATTER_FIG is None:
+        _SCATTER_FIG, _SCATTER_AX = plt.subplots(figsize=(10, 8), subplot_kw={'projection': '3d'})
+        # fixed margins instead of a tight_layout / bbox_inches='tight' pass per save
+        # (top leaves room for the two-line title, with or without a colorbar)
+        _SCATTER_FIG.subplots_adjust(left=0.05, right=0.9, bottom=0.05, top=0.88)
+        _SCATTER_SPEC = _SCATTER_AX.get_subplotspec()
+    else:
+        if _SCATTER_CBAR is not None:
+            # removing a colorbar drawn from a standalone mappable does not give
+            # its space back, so restore the axes' original subplot slot
+            _SCATTER_CBAR.remove()
+            _SCATTER_CBAR = None
+            _SCATTER_AX.set_subplotspec(_SCATTER_SPEC)
+        _SCATTER_AX.clear()
+    return _SCATTER_FIG, _SCATTER_AX
+
+
+@lru_cache(maxsize=None)
+def _particle_colors(n_particles: int) -> np.ndarray:
+    """
+    hsv RGBA colors for particle indices 0..n_particles-1, computed once per size.
+    
+    returns:
+    colors : np.ndarray of shape (n_particles, 4) - read-only RGBA color table
+    """
+    colors = plt.cm.hsv(np.linspace(0, 1, n_particles))
+    colors.setflags(write=False)
+    return colors
+
+
+@contextmanager
+def _seeded_global_rng(seed: int):
+    """
+    seed numpy's global RNG for the duration of the block, then restore it.
+    
+    SphereDynamics draws its initial state from the global RNG, so reducers that
+    need it seeded must not leave it reset for later simulations.
+    """
+    state = np.random.get_state()
+    np.random.seed(seed)
+    try:
+        yield
+    finally:
+        np.random.set_state(state)
+
+
+def _scatter_particles(ax, positions_3d: np.ndarray):
+    """
+    draw all particles as a single 3D marker collection colored by index.
+    
+    ax.scatter already batches every point into one Path3DCollection; for large
+    point clouds the remaining cost is rasterizing overlapping translucent
+    markers, so those are drawn smaller and opaque.
+    """
+    n_particles = positions_3d.shape[0]
+    large = n_particles >= LARGE_SCATTER_THRESHOLD
+    return ax.scatter(
+        positions_3d[:, 0], 
+        positions_3d[:, 1], 
+        positions_3d[:, 2],
+        c=_particle_colors(n_particles),
+        s=4 if large else 50,
+        alpha=None if large else 0.7,
+        depthshade=False
+    )
+
+
+def _add_scatter_colorbar(n_particles: int):
+    """attach the particle index colorbar to the shared scatter axes."""
+    global _SCATTER_CBAR
+    # scatter colors are pre-mapped RGBA, so the colorbar needs its own mappable
+    mappable = plt.cm.ScalarMappable(cmap='hsv', norm=Normalize(0, n_particles - 1))
+    _SCATTER_CBAR = _SCATTER_FIG.colorbar(mappable, ax=_SCATTER_AX, pad=0.1, shrink=0.8)
+    _SCATTER_CBAR.set_label('Particle Index', fontsize=11)
+    return _SCATTER_CBAR
+
+
+def run_simulation(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle', use_cache: bool = False, store_trajectory: bool = True):
+    # reuse the final state of an identical earlier run if it was cached; only
+    # final_positions and inner_products are stored, so a caller that asks for
+    # the trajectory always simulates (and refreshes the cache)
+    cache_path = CACHE_DIR / f'sim_n{n_particles}_dim{n_dimensions}_steps{n_steps}_w{zone_width}_{topology}.npz'
+    if use_cache and not store_trajectory and cache_path.exists():
+        with np.load(cache_path) as cached:
+            final_positions = cached['final_positions']
+            inner_products = cached['inner_products']
+        print(f"\nLoaded cached simulation from: {cache_path}")
+        return None, None, final_positions, inner_products
+    
     # create dynamical system with default parameters
     system = SphereDynamics(n_particles, n_dimensions, zone_width, topology)
     
-    # run simulation for 100 time steps
-    trajectory, velocity_history = system.simulate(n_steps=n_steps)
+    # run simulation for n_steps time steps; without store_trajectory the
+    # (n_steps, n_particles, n_dimensions) histories are never allocated
+    trajectory, velocity_history = system.simulate(n_steps=n_steps, store_trajectory=store_trajectory)
+    
+    # get final positions after simulation
+    final_positions = system.positions  # shape: (n_particles, n_dimensions)
 
     # compute inner product matrix
     inner_products = system.get_inner_product_matrix()
     print(f"\nInner product matrix shape: {inner_products.shape}")
     # print(f"Diagonal values (should be ~1): {np.diag(inner_products)[:5]}")
     
-    # get final positions after simulation
-    final_positions = system.positions  # shape: (n_particles, n_dimensions)
+    if use_cache:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file and rename it into place, so concurrent
+        # readers (e.g. run_sweep workers) never see a partially written .npz
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.npz.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(f, final_positions=final_positions, inner_products=inner_products)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        print(f"Simulation cached to: {cache_path}")
+    
+    return trajectory, velocity_history, final_positions, inner_products
+
+
+def plot_pca(final_positions: np.ndarray, inner_products: np.ndarray | None, n_steps: int, zone_width: float = 5.0, topology: str = 'circle', colorbar: bool = True, detailed: bool = False):
+    n_particles, n_dimensions = final_positions.shape
+    
+    # inner products <x_i, x_j> as a single matrix product when not precomputed
+    if inner_products is None:
+        inner_products = final_positions @ final_positions.T
     
     # perform PCA to reduce to 3D for visualization
-    pca = PCA(n_components=3)
-    positions_3d = pca.fit_transform(final_positions)
+    centered = final_positions - final_positions.mean(axis=0)
+    if n_dimensions >= RANDOMIZED_PCA_MIN_DIMENSIONS:
+        # only 3 components are needed, so a randomized SVD skips computing the
+        # remaining singular triplets of a wide matrix
+        U, singular_values, _ = randomized_svd(centered, n_components=3, n_oversamples=5, random_state=42)
+        positions_3d = U * singular_values
+        var_explained = singular_values ** 2 / np.sum(centered ** 2)
+    else:
+        # eigendecomposition of the small (n_dimensions, n_dimensions) covariance is
+        # much cheaper than an SVD of the full (n_particles, n_dimensions) matrix
+        covariance = centered.T @ centered / (n_particles - 1)
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)  # ascending order
+        positions_3d = centered @ eigenvectors[:, -3:][:, ::-1]
+        var_explained = eigenvalues[::-1][:3] / eigenvalues.sum()
     
     # create output directories if they don't exist
     pca_output_dir = Path("figures/pca")
@@ -34,22 +202,10 @@ def analyze_manifold_pca(n_particles: int = 100, n_dimensions: int = 6, n_steps:
     heatmap_output_dir.mkdir(parents=True, exist_ok=True)
     
     # create 3D scatter plot
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
+    fig, ax = _get_scatter_axes()
     
     # color points by their index (representing position along topology)
-    colors = np.arange(n_particles)
-    scatter = ax.scatter(
-        positions_3d[:, 0], 
-        positions_3d[:, 1], 
-        positions_3d[:, 2],
-        c=colors,
-        cmap='hsv',
-        s=50,
-        alpha=0.7,
-        edgecolors='k',
-        linewidth=0.5
-    )
+    _scatter_particles(ax, positions_3d)
     
     ax.set_xlabel('PC1', fontsize=12)
     ax.set_ylabel('PC2', fontsize=12)
@@ -58,12 +214,11 @@ def analyze_manifold_pca(n_particles: int = 100, n_dimensions: int = 6, n_steps:
                  f'After {n_steps} Steps (Topology: {topology}, Zone Width: {zone_width})',
                  fontsize=14, pad=20)
     
-    # add colorbar
-    cbar = plt.colorbar(scatter, ax=ax, pad=0.1, shrink=0.8)
-    cbar.set_label('Particle Index', fontsize=11)
+    # add colorbar (skip for faster batch runs)
+    if colorbar:
+        _add_scatter_colorbar(n_particles)
     
     # add variance explained
-    var_explained = pca.explained_variance_ratio_
     ax.text2D(0.02, 0.98, 
               f'Variance explained: {var_explained[0]:.2%}, {var_explained[1]:.2%}, {var_explained[2]:.2%}',
               transform=ax.transAxes, fontsize=10, verticalalignment='top',
@@ -71,155 +226,226 @@ def analyze_manifold_pca(n_particles: int = 100, n_dimensions: int = 6, n_steps:
     
     # save PCA figure
     pca_output_path = pca_output_dir / f'pca_plot_n{n_particles}_dim{n_dimensions}_steps{n_steps}_w{zone_width}_{topology}.png'
-    plt.tight_layout()
-    plt.savefig(pca_output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(pca_output_path, dpi=SCATTER_DPI, pil_kwargs=PNG_PIL_KWARGS)
     print(f"\nPCA plot saved to: {pca_output_path}")
     
-    plt.close()
-    
-    # create inner product matrix heatmap
-    fig, ax = plt.subplots(figsize=(10, 8))
-    
-    im = ax.imshow(inner_products, cmap='RdBu_r', aspect='auto', interpolation='nearest')
-    
-    ax.set_xlabel('Particle Index', fontsize=12)
-    ax.set_ylabel('Particle Index', fontsize=12)
-    ax.set_title('Inner Product Matrix', fontsize=14)
-    
-    # add colorbar
-    cbar = plt.colorbar(im, ax=ax)
-    cbar.set_label('Inner Product', fontsize=11)
-    
-    # save heatmap figure
     heatmap_output_path = heatmap_output_dir / f'inner_product_n{n_particles}_dim{n_dimensions}_steps{n_steps}_w{zone_width}_{topology}.png'
-    plt.tight_layout()
-    plt.savefig(heatmap_output_path, dpi=300, bbox_inches='tight')
+    
+    if detailed:
+        # create inner product matrix heatmap with axes, labels and colorbar
+        fig, ax = plt.subplots(figsize=(6, 5))
+        fig.subplots_adjust(**HEATMAP_MARGINS)
+        
+        im = ax.imshow(inner_products, cmap='RdBu_r', aspect='auto', interpolation='nearest')
+        
+        ax.set_xlabel('Particle Index', fontsize=12)
+        ax.set_ylabel('Particle Index', fontsize=12)
+        ax.set_title('Inner Product Matrix', fontsize=14)
+        
+        # add colorbar (skip for faster batch runs)
+        if colorbar:
+            cbar = plt.colorbar(im, ax=ax)
+            cbar.set_label('Inner Product', fontsize=11)
+        
+        # save heatmap figure
+        plt.savefig(heatmap_output_path, dpi=HEATMAP_DPI, pil_kwargs=PNG_PIL_KWARGS)
+        
+        plt.close()
+    else:
+        # colormap inner products in [-1, 1] straight to RGB pixels and encode
+        # with PIL, bypassing figure, axes and colorbar construction entirely
+        normalized = (inner_products + 1) / 2
+        rgb = (matplotlib.colormaps['RdBu_r'](normalized)[..., :3] * 255).astype(np.uint8)
+        scale = max(1, HEATMAP_IMAGE_SIZE // n_particles)
+        image = Image.fromarray(rgb).resize((n_particles * scale, n_particles * scale), Image.Resampling.NEAREST)
+        image.save(heatmap_output_path, **PNG_PIL_KWARGS)
     print(f"Inner product heatmap saved to: {heatmap_output_path}")
     
-    plt.close()
+    return positions_3d
+
+
+def analyze_manifold_pca(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle'):
+    trajectory, velocity_history, final_positions, inner_products = run_simulation(
+        n_particles, n_dimensions, n_steps, zone_width, topology
+    )
+    positions_3d = plot_pca(final_positions, inner_products, n_steps, zone_width, topology)
     
     return trajectory, velocity_history, inner_products, positions_3d
 
 
-def analyze_manifold_umap(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle'):
-    # create dynamical system with default parameters
-    system = SphereDynamics(n_particles, n_dimensions, zone_width, topology)
-    
-    # run simulation for 100 time steps
-    trajectory, velocity_history = system.simulate(n_steps=n_steps)
-    
-    # get final positions after simulation
-    final_positions = system.positions  # shape: (n_particles, n_dimensions)
+def plot_umap(final_positions: np.ndarray, n_steps: int, zone_width: float = 5.0, topology: str = 'circle', colorbar: bool = True, n_jobs: int = -1):
+    n_particles, n_dimensions = final_positions.shape
     
     # perform UMAP to reduce to 3D for visualization
-    reducer = UMAP(n_components=3, random_state=42)
-    positions_3d = reducer.fit_transform(final_positions)
+    if n_dimensions <= 3:
+        # already at most 3D: plot the raw coordinates and skip the reducer
+        positions_3d = np.pad(final_positions, ((0, 0), (0, 3 - n_dimensions)))
+        axis_prefix = 'x'
+        title_prefix = 'Raw Coordinates (No UMAP Reduction Applied)'
+    else:
+        axis_prefix = 'UMAP'
+        title_prefix = 'UMAP Projection'
+        # passing random_state forces UMAP onto its single-threaded path, so seed
+        # numpy's global RNG instead and let nearest-neighbor descent run in parallel
+        reducer = UMAP(n_components=3, n_jobs=n_jobs, low_memory=False)
+        with _seeded_global_rng(42):
+            # float32 is ample precision for visualization and halves memory traffic
+            positions_3d = reducer.fit_transform(np.ascontiguousarray(final_positions, dtype=np.float32))
     
     # create output directories if they don't exist
     umap_output_dir = Path("figures/umap")
     umap_output_dir.mkdir(parents=True, exist_ok=True)
     
     # create 3D scatter plot
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
+    fig, ax = _get_scatter_axes()
     
     # color points by their index (representing position along topology)
-    colors = np.arange(n_particles)
-    scatter = ax.scatter(
-        positions_3d[:, 0], 
-        positions_3d[:, 1], 
-        positions_3d[:, 2],
-        c=colors,
-        cmap='hsv',
-        s=50,
-        alpha=0.7,
-        edgecolors='k',
-        linewidth=0.5
-    )
+    _scatter_particles(ax, positions_3d)
     
-    ax.set_xlabel('UMAP1', fontsize=12)
-    ax.set_ylabel('UMAP2', fontsize=12)
-    ax.set_zlabel('UMAP3', fontsize=12)
-    ax.set_title(f'UMAP Projection of {n_particles} Particles on {n_dimensions-1}-Sphere\n'
+    ax.set_xlabel(f'{axis_prefix}1', fontsize=12)
+    ax.set_ylabel(f'{axis_prefix}2', fontsize=12)
+    ax.set_zlabel(f'{axis_prefix}3', fontsize=12)
+    ax.set_title(f'{title_prefix} of {n_particles} Particles on {n_dimensions-1}-Sphere\n'
                  f'After {n_steps} Steps (Topology: {topology}, Zone Width: {zone_width})',
                  fontsize=14, pad=20)
     
-    # add colorbar
-    cbar = plt.colorbar(scatter, ax=ax, pad=0.1, shrink=0.8)
-    cbar.set_label('Particle Index', fontsize=11)
+    # add colorbar (skip for faster batch runs)
+    if colorbar:
+        _add_scatter_colorbar(n_particles)
     
     # save UMAP figure
     umap_output_path = umap_output_dir / f'umap_plot_n{n_particles}_dim{n_dimensions}_steps{n_steps}_w{zone_width}_{topology}.png'
-    plt.tight_layout()
-    plt.savefig(umap_output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(umap_output_path, dpi=SCATTER_DPI, pil_kwargs=PNG_PIL_KWARGS)
     print(f"\nUMAP plot saved to: {umap_output_path}")
     
-    plt.close()
+    return positions_3d
+
+
+def analyze_manifold_umap(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle'):
+    trajectory, velocity_history, final_positions, _ = run_simulation(
+        n_particles, n_dimensions, n_steps, zone_width, topology
+    )
+    positions_3d = plot_umap(final_positions, n_steps, zone_width, topology)
     
     return trajectory, velocity_history, positions_3d
 
 
-def analyze_manifold_tsne(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle'):
-    # create dynamical system with default parameters
-    system = SphereDynamics(n_particles, n_dimensions, zone_width, topology)
-    
-    # run simulation for 100 time steps
-    trajectory, velocity_history = system.simulate(n_steps=n_steps)
-    
-    # get final positions after simulation
-    final_positions = system.positions  # shape: (n_particles, n_dimensions)
+def plot_tsne(final_positions: np.ndarray, n_steps: int, zone_width: float = 5.0, topology: str = 'circle', colorbar: bool = True, n_jobs: int = -1):
+    n_particles, n_dimensions = final_positions.shape
     
     # perform t-SNE to reduce to 3D for visualization
-    reducer = TSNE(n_components=3, random_state=42)
-    positions_3d = reducer.fit_transform(final_positions)
+    if n_dimensions <= 3:
+        # already at most 3D: plot the raw coordinates and skip the reducer
+        positions_3d = np.pad(final_positions, ((0, 0), (0, 3 - n_dimensions)))
+        axis_prefix = 'x'
+        title_prefix = 'Raw Coordinates (No t-SNE Reduction Applied)'
+    else:
+        axis_prefix = 't-SNE'
+        title_prefix = 't-SNE Projection'
+        # openTSNE runs the neighbor search on n_jobs cores; FFT interpolation only
+        # supports up to 2D embeddings, so use Barnes-Hut for the 3D gradient
+        reducer = TSNE(
+            n_components=3,
+            neighbors="approx",
+            negative_gradient_method="bh",
+            n_jobs=n_jobs,
+            random_state=42,
+        )
+        # float32 is ample precision for visualization and halves memory traffic
+        positions_3d = np.asarray(reducer.fit(np.ascontiguousarray(final_positions, dtype=np.float32)))
     
     # create output directories if they don't exist
     tsne_output_dir = Path("figures/tsne")
     tsne_output_dir.mkdir(parents=True, exist_ok=True)
     
     # create 3D scatter plot
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
+    fig, ax = _get_scatter_axes()
     
     # color points by their index (representing position along topology)
-    colors = np.arange(n_particles)
-    scatter = ax.scatter(
-        positions_3d[:, 0], 
-        positions_3d[:, 1], 
-        positions_3d[:, 2],
-        c=colors,
-        cmap='hsv',
-        s=50,
-        alpha=0.7,
-        edgecolors='k',
-        linewidth=0.5
-    )
+    _scatter_particles(ax, positions_3d)
     
-    ax.set_xlabel('t-SNE1', fontsize=12)
-    ax.set_ylabel('t-SNE2', fontsize=12)
-    ax.set_zlabel('t-SNE3', fontsize=12)
-    ax.set_title(f't-SNE Projection of {n_particles} Particles on {n_dimensions-1}-Sphere\n'
+    ax.set_xlabel(f'{axis_prefix}1', fontsize=12)
+    ax.set_ylabel(f'{axis_prefix}2', fontsize=12)
+    ax.set_zlabel(f'{axis_prefix}3', fontsize=12)
+    ax.set_title(f'{title_prefix} of {n_particles} Particles on {n_dimensions-1}-Sphere\n'
                  f'After {n_steps} Steps (Topology: {topology}, Zone Width: {zone_width})',
                  fontsize=14, pad=20)
     
-    # add colorbar
-    cbar = plt.colorbar(scatter, ax=ax, pad=0.1, shrink=0.8)
-    cbar.set_label('Particle Index', fontsize=11)
+    # add colorbar (skip for faster batch runs)
+    if colorbar:
+        _add_scatter_colorbar(n_particles)
     
     # save t-SNE figure
     tsne_output_path = tsne_output_dir / f'tsne_plot_n{n_particles}_dim{n_dimensions}_steps{n_steps}_w{zone_width}_{topology}.png'
-    plt.tight_layout()
-    plt.savefig(tsne_output_path, dpi=300, bbox_inches='tight')
+    fig.savefig(tsne_output_path, dpi=SCATTER_DPI, pil_kwargs=PNG_PIL_KWARGS)
     print(f"\nt-SNE plot saved to: {tsne_output_path}")
     
-    plt.close()
+    return positions_3d
+
+
+def analyze_manifold_tsne(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle'):
+    trajectory, velocity_history, final_positions, _ = run_simulation(
+        n_particles, n_dimensions, n_steps, zone_width, topology
+    )
+    positions_3d = plot_tsne(final_positions, n_steps, zone_width, topology)
     
     return trajectory, velocity_history, positions_3d
 
 
+def warm_up_umap():
+    """
+    compile UMAP's numba kernels by fitting a tiny random dataset.
+    
+    compilation is per process and most of UMAP's kernels are not cached to disk,
+    so this only moves the JIT cost of the first fit in the current process up front.
+    """
+    rng = np.random.RandomState(0)
+    with _seeded_global_rng(0):
+        UMAP(n_components=3, n_jobs=-1, low_memory=False).fit_transform(rng.rand(20, 3))
+
+
+def _analyze_config(n_particles: int = 100, n_dimensions: int = 6, n_steps: int = 100, zone_width: float = 5.0, topology: str = 'circle', use_cache: bool = False, colorbar: bool = True):
+    # simulate one configuration and save all of its projections
+    _, _, final_positions, inner_products = run_simulation(
+        n_particles, n_dimensions, n_steps, zone_width, topology,
+        use_cache=use_cache, store_trajectory=False
+    )
+    positions_pca = plot_pca(final_positions, inner_products, n_steps, zone_width, topology, colorbar=colorbar)
+    # sweeps already run one configuration per core, so keep the reducers
+    # single-threaded to avoid oversubscribing the CPU
+    positions_umap = plot_umap(final_positions, n_steps, zone_width, topology, colorbar=colorbar, n_jobs=1)
+    positions_tsne = plot_tsne(final_positions, n_steps, zone_width, topology, colorbar=colorbar, n_jobs=1)
+    
+    return positions_pca, positions_umap, positions_tsne
+
+
+def run_sweep(configs: list[dict], n_jobs: int = -1):
+    """
+    simulate and plot many parameter configurations in parallel.
+    
+    each config is a dict with any of the keys n_particles, n_dimensions, n_steps,
+    zone_width, topology, use_cache (as in run_simulation) and colorbar (as in the
+    plot functions; False skips the colorbars for faster batch runs). each config
+    runs in its own process (loky backend), so matplotlib state is never shared
+    between workers.
+    
+    returns:
+    results : list of (positions_pca, positions_umap, positions_tsne) tuples, one per config
+    """
+    return Parallel(n_jobs=n_jobs, backend='loky')(
+        delayed(_analyze_config)(**config) for config in configs
+    )
+
+
 if __name__ == "__main__":
-    analyze_manifold_pca(n_particles=100, n_dimensions=3, n_steps=100000, zone_width=5.0, topology='circle')
+    # run the simulation once and reuse the final state for every projection
+    trajectory, velocity_history, final_positions, inner_products = run_simulation(
+        n_particles=100, n_dimensions=3, n_steps=100000, zone_width=5.0, topology='circle',
+        store_trajectory=False
+    )
+
+    plot_pca(final_positions, inner_products, n_steps=100000, zone_width=5.0, topology='circle')
 
-    analyze_manifold_umap(n_particles=100, n_dimensions=3, n_steps=100000, zone_width=5.0, topology='circle')
+    plot_umap(final_positions, n_steps=100000, zone_width=5.0, topology='circle')
 
-    analyze_manifold_tsne(n_particles=100, n_dimensions=3, n_steps=100000, zone_width=5.0, topology='circle')
\ No newline at end of file
+    plot_tsne(final_positions, n_steps=100000, zone_width=5.0, topology='circle')